@@ -0,0 +1,84 @@
+"""YAML loading helpers shared by the logging setup and the configuration manager.
+
+PyYAML falls back to its pure-Python parser and emitter unless they are requested explicitly,
+so the libyaml-backed CSafeLoader/CSafeDumper are selected here whenever PyYAML was built with them.
+Parsed documents are memoized in-process, keyed by the source file's path, mtime and size,
+so unchanged files skip YAML parsing on later loads within the same run.
+"""
+
+from __future__ import annotations
+import copy
+import yaml
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+try:
+    from yaml import CSafeLoader as SafeLoader
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader
+    from yaml import SafeDumper
+if TYPE_CHECKING:
+    from typing import Any, Union
+
+
+_BUFFER_SIZE = 1024 * 1024
+
+
+def load_yaml(path: Union[Path, str], cache: bool = True) -> Any:
+    """Parse a YAML file with the fastest available safe loader.
+
+    Args:
+        path (Union[Path, str]): Path to the YAML file.
+        cache (bool): If True, reuse the document parsed earlier in this process while the file's
+            mtime and size are unchanged.
+
+    Returns:
+        Any: The parsed YAML document. Cached documents are returned as copies, so callers may mutate them.
+    """
+    path = Path(path)
+    if not cache:
+        return _parse(path)
+    stat = path.stat()
+    return copy.deepcopy(_load_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
+def load_yaml_bytes(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse an in-memory YAML document (e.g. a downloaded manifest) with the fastest available safe loader.
+
+    Args:
+        data (Union[bytes, bytearray, str]): The raw YAML document.
+
+    Returns:
+        Any: The parsed YAML document.
+    """
+    if isinstance(data, bytearray):
+        # PyYAML only reads str, bytes or streams
+        data = bytes(data)
+    return yaml.load(data, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any, path: Union[Path, str]) -> None:
+    """Write data as YAML with the fastest available safe dumper, keeping key order.
+
+    Args:
+        data (Any): The document to serialize.
+        path (Union[Path, str]): Destination file path.
+    """
+    with open(path, 'w', buffering=_BUFFER_SIZE) as f:
+        yaml.dump(data, f, Dumper=SafeDumper, sort_keys=False)
+
+
+def _parse(path: Path) -> Any:
+    # binary mode lets libyaml consume raw bytes and detect the encoding itself
+    with open(path, 'rb', buffering=_BUFFER_SIZE) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+@lru_cache(maxsize=64)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parses the file once per (path, mtime, size); edited files get a new key and are parsed again."""
+    return _parse(Path(path))
+
+
+__all__ = ['SafeLoader', 'SafeDumper', 'load_yaml', 'load_yaml_bytes', 'dump_yaml']
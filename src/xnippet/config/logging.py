@@ -2,7 +2,6 @@ import os
 import logging
 import logging.config
 import sys
-import yaml
 from pathlib import Path
 
 
@@ -10,7 +9,7 @@ def setup(path: Path = None, default_level=logging.INFO, env_key='LOG_CFG'):
     """    
     | Logging Setup
     |
-    :param default_path: Logging configuration path
+    :param path: Logging configuration path (programmatic default config if None)
     :param default_level: Default logging level
     :param env_key: Logging config path set in environment variable
     """
@@ -18,15 +17,21 @@ def setup(path: Path = None, default_level=logging.INFO, env_key='LOG_CFG'):
     default_kw = {"format": "%(message)s", "level":default_level, "stream": sys.stdout}
     if value:
         path = value
-    if os.path.exists(path):
-        with open(path, 'rt') as f:
-            try:
-                config = yaml.safe_load(f.read())
-                logging.config.dictConfig(config)                
-            except Exception as e:
-                logging.warning('Error in Logging Configuration. %e', e)
-                logging.debug('Using default config.')
-                logging.basicConfig(**default_kw)                
-    else:
+    if path is None:
+        # no configuration file requested; configure programmatically without touching YAML
+        logging.basicConfig(**default_kw)
+        logging.debug('Using default config.')
+        return None
+    try:
+        # imported here so that the YAML parser is only loaded when a config file is requested
+        from .loader import load_yaml
+        # logging is configured once per process, so skip the stat/resolve of the in-process cache
+        config = load_yaml(path, cache=False)
+        logging.config.dictConfig(config)
+    except FileNotFoundError:
+        logging.basicConfig(**default_kw)
+        logging.debug('Using default config.')
+    except Exception as e:
+        logging.warning('Error in Logging Configuration. %s', e)
+        logging.debug('Using default config.')
         logging.basicConfig(**default_kw)
-        logging.debug('Using default config.')
\ No newline at end of file
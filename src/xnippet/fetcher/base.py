@@ -13,7 +13,6 @@ from __future__ import annotations
 import re
 import logging
 import warnings
-import requests
 from xnippet.formatter import PathFormatter
 from xnippet.raiser import WarnRaiser
 from typing import TYPE_CHECKING
@@ -21,6 +20,7 @@ if TYPE_CHECKING:
     from typing import Optional, Union
     from typing import List, Tuple, Generator
     from logging import Logger
+    import requests
 
 class Fetcher(PathFormatter):
     """Base class for fetching remote content with methods to authenticate and navigate repositories.
@@ -34,6 +34,7 @@ class Fetcher(PathFormatter):
         _auth (Union[List[Tuple[str, str]], Tuple[str, str]]): Authentication credentials for the repository.
         repos (dict): Configuration for the repositories to be accessed.
     """
+    __slots__ = ()
     _auth: Union[List[Tuple[str, str]], Tuple[str, str]]
     _repos: dict
     _logger: Logger = logging.getLogger(__name__)
@@ -45,6 +46,7 @@ class Fetcher(PathFormatter):
         Returns:
             bool: True if the connection is successful, False otherwise.
         """
+        import requests
         try:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore", UserWarning)
@@ -177,6 +179,7 @@ class Fetcher(PathFormatter):
         Returns:
             Optional[requests.Response]: The response object if successful, otherwise None.
         """
+        import requests
         Fetcher._logger.debug(" + Sending request to %s", url)
         response = requests.get(url, auth=auth)
         Fetcher._logger.debug(" - Request Status Code: %s", response.status_code)
@@ -207,6 +210,7 @@ class Fetcher(PathFormatter):
         Returns:
             Union[Generator, bool]: A generator yielding file chunks if successful, False on error.
         """
+        import requests
         try:
             Fetcher._logger.debug(" + Downloading %s [ChunkSize: %s ;auth=%s]", url, chunk_size, True if auth else False)
             response = requests.get(url, stream=True, auth=auth)
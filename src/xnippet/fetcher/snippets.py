@@ -101,9 +101,11 @@ class Snippets(Fetcher):
             return None
         contents = []
         for path, dirs, files in os.walk(self.path):
-            child = {'path':self._resolve(path), 
-                     'dirs':{d:self._resolve(path) / d for d in dirs}, 
-                     'files':{f:self._resolve(path) / f for f in files}}
+            # self.path is already resolved, so every walked path only needs a Path wrapper
+            path = Path(path)
+            child = {'path':path,
+                     'dirs':{d:path / d for d in dirs},
+                     'files':{f:path / f for f in files}}
             contents.append(child)
         self._convert_contents_to_snippets([contents], remote=False)
             
@@ -2,5 +2,7 @@ from pathlib import Path as _Path
 
 
 class Path:
+    __slots__ = ()
+    
     def _resolve(self, path: _Path):
         return _Path(path).expanduser().resolve()
\ No newline at end of file
@@ -8,10 +8,11 @@ from __future__ import annotations
 
 import itertools
 import re
+from functools import lru_cache
 from typing import Any, Callable, NamedTuple, SupportsInt, Tuple, Union
 
 
-__all__ = ["VERSION_PATTERN", "parse", "Version", "InvalidVersion"]
+__all__ = ["VERSION_PATTERN", "parse", "cached_parse", "Version", "InvalidVersion"]
 
 
 class InfinityType:
@@ -110,6 +111,16 @@ def parse(version: str) -> Version:
     return Version(version)
 
 
+@lru_cache(maxsize=512)
+def cached_parse(version: str) -> Version:
+    """Parse the given version string, sharing the immutable Version across identical inputs.
+
+    :param version: The version string to parse.
+    :raises InvalidVersion: When the version string is not a valid version.
+    """
+    return Version(version)
+
+
 class InvalidVersion(ValueError):
     """Raised when a version string is not a valid version.
 
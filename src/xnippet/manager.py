@@ -7,20 +7,27 @@ requested by the user through CLI to create them in the home folder.
 
 from __future__ import annotations
 import logging
-import yaml
 import shutil
 from pathlib import Path
 from .fetcher import PlugInFetcher
 from typing import TYPE_CHECKING
 from .formatter import PathFormatter
 from .formatter import IOFormatter
-from .formatter import version
+from .formatter.version import cached_parse
 from .raiser import WarnRaiser
 if TYPE_CHECKING:
     from .types import SnippetMode, StorageMode, SnippetPath, PlugInSnippetType
     from .types import PlugInFetcherType, VersionType
     from typing import List, Union, Optional
     from logging import Logger
+
+
+_DEFAULT_CONFIG = Path(__file__).resolve().parent / 'config' / 'main.yaml'
+
+
+def _resolve_home() -> Path:
+    """Resolve the user's home directory; Manager calls this once per instance."""
+    return Path('~').expanduser().resolve()
     
 
 class Manager(PathFormatter):
@@ -36,10 +43,17 @@ class Manager(PathFormatter):
     _local_dir: 'Path'
     _global_dir: 'Path'
     _config_dir: 'Path'
+    _local_config_file: 'Path'
+    _global_config_file: 'Path'
+    _package_config_file: 'Path'
+    _config_file: 'Path'
+    _config_signature: Optional[tuple]
+    _config_created: Optional[Union[StorageMode, list[str], bool]]
     _fname: str
     _package_name: str
     _package_version: VersionType
     _fetcher: PlugInFetcherType
+    _installed_index: Optional[frozenset]
     _compatible_snippets: List[SnippetMode] = ['plugin']
     _logger: Logger = logging.getLogger(__name__)
     
@@ -59,28 +73,48 @@ class Manager(PathFormatter):
             tmpdir (Optional[Path]): Temporary directory for storing configurations, defaults to the home directory.
         """
         self._package_name = package_name
-        self._home_dir = self._resolve('~')
-        self._package_dir = self._resolve(package__file__).parent / config_path if config_path else self._resolve(package__file__).parent
-        self._local_dir = self._resolve(Path.cwd() / f'.{self._package_name}')
-        self._global_dir = self._resolve(self._home_dir / f'.{self._package_name}')
+        self._home_dir = _resolve_home()
+        package_dir = self._resolve(package__file__).parent
+        self._package_dir = package_dir / config_path if config_path else package_dir
+        # cwd and the resolved home directory are already absolute, so no further resolve() is needed
+        self._local_dir = Path.cwd() / f'.{self._package_name}'
+        self._global_dir = self._home_dir / f'.{self._package_name}'
         self._fname = config_filename
-        self._package_version = version.parse(package_version)
+        self._local_config_file = self._local_dir / self._fname
+        self._global_config_file = self._global_dir / self._fname
+        self._package_config_file = self._package_dir / self._fname
+        self._package_version = cached_parse(package_version)
+        self._config_created = None
+        self._config_signature = None
+        self._installed_index = None
         self.reload()
 
     ## Initiation step
-    def reload(self) -> None:
-        """Loads an existing configuration file or creates a new one if it does not exist, filling the 'config' dictionary with settings."""
+    def reload(self, force: bool = False) -> None:
+        """Loads an existing configuration file or creates a new one if it does not exist, filling the 'config' dictionary with settings.
+        
+        Args:
+            force (bool): If True, re-read the configuration and rebuild the plugin fetcher even if the
+                configuration file is unchanged (same path, modification time and size) since the last
+                reload; otherwise that case is skipped. Use it after changing the plugin folder.
+        """
         self._set_config_dir()
-        config_file = self.config_dir / self._fname
+        config_file = self._config_file
         if not config_file.exists() and self.config_dir == self._package_dir:
             WarnRaiser(self.reload).config_file(self.config_dir, 
                                                 exists=False, 
                                                 comment="Import xnippet's default config file.")
-            config_file = self._resolve(__file__).parent / 'config/main.yaml'
-        with open(config_file, 'r') as f:
-            self.config = yaml.safe_load(f)
-            self._logger.debug("Configuration imported from: %s", config_file)
+            config_file = _DEFAULT_CONFIG
+        stat = config_file.stat()
+        signature = (config_file, stat.st_mtime_ns, stat.st_size)
+        if not force and signature == self._config_signature:
+            self._logger.debug("Configuration unchanged, skip reloading: %s", config_file)
+            return None
+        from .config.loader import load_yaml
+        self.config = load_yaml(config_file)
+        self._logger.debug("Configuration imported from: %s", config_file)
         self._reload_plugin_fetcher()
+        self._config_signature = signature
     
     def _set_config_dir(self):
         """Sets the configuration directory based on the existence and type of configuration files.
@@ -95,23 +129,27 @@ class Manager(PathFormatter):
                             a string indicates only one configuration is available, and None indicates no configurations are found.
         
         Side Effects:
-            Sets self._config_dir to the appropriate directory based on the existing configuration.
+            Sets self._config_dir and self._config_file to the appropriate directory and file based on the existing configuration.
             Logs debug messages about the configuration status and actions taken.
             Raises a warning if no configuration files are found, advising the creation of a configuration file.
 
         Raises:
             WarnRaiser: If no configuration file exists, this raises a configurable warning through the WarnRaiser class.
         """
-        if isinstance(self.config_created, list):
-            self._logger.debug("Config folders have been created for both %s and %s exist.", *self.config_created)
-            self._config_dir = self._local_dir
-        elif isinstance(self.config_created, str):
-            self._logger.debug("The '%s' config folder has been created.", self.config_created.capitalize())
-            self._config_dir = self._local_dir if self.config_created == 'local' else self._global_dir
+        config_created = self.config_created
+        if isinstance(config_created, list):
+            self._logger.debug("Config folders have been created for both %s and %s exist.", *config_created)
+            self._config_dir, self._config_file = self._local_dir, self._local_config_file
+        elif isinstance(config_created, str):
+            self._logger.debug("The '%s' config folder has been created.", config_created.capitalize())
+            if config_created == 'local':
+                self._config_dir, self._config_file = self._local_dir, self._local_config_file
+            else:
+                self._config_dir, self._config_file = self._global_dir, self._global_config_file
         else:
             self._logger.debug("Config folder was not created, "
                                "using package directory (%s) and search config file.", self._package_dir)
-            self._config_dir = self._package_dir
+            self._config_dir, self._config_file = self._package_dir, self._package_config_file
 
     def _reload_plugin_fetcher(self) -> None:
         """Retrieves a configured SnippetsFetcher for the specified mode to handle fetching of snippets.
@@ -126,19 +164,37 @@ class Manager(PathFormatter):
                                       package_name=self._package_name,
                                       package_version=self._package_version,
                                       path=self._check_dir())
+        self._installed_index = None
+    
+    def _index_installed(self) -> frozenset:
+        """Indexes installed plugins by 'name' and 'name==version' for constant-time membership checks.
+
+        The index is built on first use from the plugins found by the fetcher's latest local walk,
+        so it does not walk the plugin folder again; it is dropped whenever the fetcher is rebuilt or
+        `installed` walks the folder again, keeping it in line with `installed` and `get`.
+        """
+        if self._installed_index is None:
+            installed = self._fetcher._local_snippets
+            self._installed_index = frozenset([p.name for p in installed] + 
+                                              [f'{p.name}=={str(p.version)}' for p in installed])
+        return self._installed_index
     
     @property
     def config_created(self) -> Union[StorageMode, list[str], bool]:
         """"Checks and returns the location where the configuration folder was created.
 
+        The result is cached and only re-checked after `create_config` or `delete_config`.
+
         Returns:
             Union[Literal['global', 'local'], list[str], bool]: Returns 'global' or 'local' if the config folder was created at that level,
             a list of locations if multiple exist, or False if no config folder is created.
         """
-        created = [(f / self._fname).exists() for f in [self._global_dir, self._local_dir]]
-        checked = [loc for i, loc in enumerate(['global', 'local']) if created[i]]
-        checked = checked.pop() if len(checked) == 1 else checked
-        return checked or False
+        if self._config_created is None:
+            checked = [loc for loc, f in (('global', self._global_config_file), ('local', self._local_config_file)) 
+                       if f.exists()]
+            checked = checked.pop() if len(checked) == 1 else checked
+            self._config_created = checked or False
+        return self._config_created
 
     @property
     def config_dir(self) -> 'Path':
@@ -160,18 +216,21 @@ class Manager(PathFormatter):
         Returns:
             bool: Returns True if the file was successfully created, otherwise False.
         """
-        config_dir = self._local_dir if target == 'local' else self._global_dir
+        if target == 'local':
+            config_dir, config_file = self._local_dir, self._local_config_file
+        else:
+            config_dir, config_file = self._global_dir, self._global_config_file
         config_dir.mkdir(exist_ok=True)
-        config_file = config_dir / self._fname
         if config_file.exists():
             if not force:
                 WarnRaiser(self.create_config).config_file(config_dir=config_dir, 
                                                            exists=True, 
                                                            comment="Use the force option to overwrite.")
                 return False
-        with open(config_file, 'w') as f:
-            yaml.safe_dump(self.config, f, sort_keys=False)
-        self.reload()
+        from .config.loader import dump_yaml
+        dump_yaml(self.config, config_file)
+        self._config_created = None
+        self.reload(force=True)
     
     def delete_config(self, target: StorageMode, yes: bool = False):
         path = self._local_dir if target == 'local' else self._global_dir
@@ -185,7 +244,8 @@ class Manager(PathFormatter):
                 shutil.rmtree(path)
                 removed = True
         if removed:
-            self.reload()
+            self._config_created = None
+            self.reload(force=True)
     
     def _check_dir(self) -> SnippetPath:
         """Checks and prepares the directory for the specified snippet type, ensuring it exists.
@@ -195,20 +255,22 @@ class Manager(PathFormatter):
                                 if caching is necessary (True if so).
         """
         path, cache = (self.config_dir / 'plugin', False) if self.config_created else (None, True)
-        if path and not path.exists():
-            path.mkdir()
+        if path:
+            path.mkdir(exist_ok=True)
         return path, cache
         
     @property
     def avail(self) -> List[PlugInSnippetType]:
         """Check list of plugins not installed but available in remote repository"""
-        installed = [f'{p.name}=={str(p.version)}' for p in self.installed]
-        return [p for p in self._fetcher.remote if f'{p.name}=={str(p.version)}' not in installed]
+        return [p for p in self._fetcher.remote if f'{p.name}=={str(p.version)}' not in self._index_installed()]
     
     @property
     def installed(self) -> List[PlugInSnippetType]:
         """Check list of installed plugins."""
-        return self._fetcher.local
+        installed = self._fetcher.local
+        # the walk may have picked up plugins added since the index was built
+        self._installed_index = None
+        return installed
     
     def get(self, plugin_name: str, 
             plugin_version: Optional[str] = None, 
@@ -227,7 +289,8 @@ class Manager(PathFormatter):
         return [s for s in self.installed if keyword == s.name]
     
     def is_installed(self, plugin_name: str, version: Optional[str] = None):
-        return True if self.get(plugin_name, version) else False
+        keyword = f'{plugin_name}=={version}' if version else plugin_name
+        return keyword in self._index_installed()
     
     def install(self, plugin_name: str, 
                 plugin_version: Optional[str] = None, 
@@ -244,7 +307,8 @@ class Manager(PathFormatter):
             WarnRaiser(self.install).config_file(self.config_dir, exists=True)
             if yes or IOFormatter.ask_yes_or_no(f"Do you want to overwrite plugin '{target}' configuration?"):
                 plugin.download(dest=plugin_dir, force=yes)
+                self.reload(force=True)
                 return True
             return False
         plugin.download(dest=plugin_dir)
-        self.reload()
+        self.reload(force=True)
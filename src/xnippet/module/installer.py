@@ -4,7 +4,7 @@ import subprocess
 import warnings
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from typing import Literal, Optional
+    from typing import Literal, Optional, List
 
 
 class Installer:
@@ -21,16 +21,32 @@ class Installer:
                 module_name: Optional[str], 
                 version: Optional[str] = None, 
                 version_constraint: Literal['==', '!=', '>=', '<='] = "==",
-                upgrade: bool = False):
+                upgrade: bool = False) -> bool:
+        spec = f"{module_name}{version_constraint}{version}" if version else module_name
+        return self.install_many([spec], upgrade=upgrade)
+    
+    def install_many(self, specs: List[str], upgrade: bool = False) -> bool:
+        """Install several requirement specifiers with a single pip invocation.
+
+        Args:
+            specs (List[str]): Requirement specifiers such as 'numpy>=1.20'.
+            upgrade (bool): If True, pass '--upgrade' to pip.
+
+        Returns:
+            bool: True if pip exited successfully (or there was nothing to install).
+        """
+        if not specs:
+            return True
         self._mode = 'install'
-        self._module = f"{module_name}{version_constraint}{version}"
+        self._module = ', '.join(specs)
         cmd = [sys.executable, "-m", "pip", "install"]
         if upgrade:
             cmd.append("--upgrade")
-        cmd.append(self._module)
+        cmd.extend(specs)
         self._cmd = cmd
-        self._exec()
+        succeeded = self._exec()
         self._reset()
+        return succeeded
     
     def _reset(self):
         self._cmd = [sys.executable, '-m', 'pip']
@@ -39,7 +55,7 @@ class Installer:
         self._module = None
         self._counter = 0
     
-    def _exec(self):
+    def _exec(self) -> bool:
         with subprocess.Popen(self._cmd, 
                               stdout=subprocess.PIPE, 
                               stderr=subprocess.PIPE, 
@@ -52,6 +68,8 @@ class Installer:
             proc.wait()
             if self._proc.returncode != 0:
                 warnings.warn(f"'Errors during resolving dependencies': {''.join(proc.stderr)}")
+                return False
+            return True
 
     def _line_capture(self, line):
         if self._mode == 'install':
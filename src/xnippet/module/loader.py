@@ -23,16 +23,16 @@ class Loader(SourceLoader):
     where plugins or modules need to be loaded from non-standard locations or directly from memory.
 
     Attributes:
-        data (bytes, optional): The bytes object containing the source code of the module.
+        data (Union[bytes, bytearray], optional): The buffer containing the source code of the module.
         filepath (Path, optional): The file path to the module if it's not loaded from bytes.
     """
-    def __init__(self, module: Union[Path, bytes]):
+    def __init__(self, module: Union[Path, bytes, bytearray]):
         """Initializes the ModuleLoader with either a path to the module or its bytes content.
 
         Args:
-            module (Union[Path, bytes]): The source of the module, either as a path or bytes.
+            module (Union[Path, bytes, bytearray]): The source of the module, either as a path or an in-memory buffer.
         """
-        if isinstance(module, bytes):
+        if isinstance(module, (bytes, bytearray)):
             self.data, self.filepath = module, None
         else:
             self.data, self.filepath = None, module
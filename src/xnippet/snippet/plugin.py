@@ -12,19 +12,44 @@ Author: Sung-Ho Lee (shlee@unc.edu)
 
 from __future__ import annotations
 import re
-import yaml
 import inspect
+import operator
 from pathlib import Path
 from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
 from .simple import Simple
 from xnippet.raiser import WarnRaiser
 from xnippet.module import ModuleLoader
 from xnippet.module import ModuleInstaller
 from xnippet.formatter import StringFormatter
+from xnippet.formatter.version import cached_parse, InvalidVersion
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from typing import Tuple, Dict, Optional, Union
-    
+    from typing import Tuple, Dict, List, Optional, Union
+
+
+_SOURCE_RE = re.compile(r'(?P<filename>[a-zA-Z0-9_-]+\.py)(?::(?P<target>[a-zA-Z][a-zA-Z0-9\_\-]*))?')
+_DEP_RE = re.compile(r'(\w+)\s*(>=|<=|==|!=|>|<)\s*([0-9]+(?:\.[0-9]+)*)?')
+_DOWNLOAD_CHUNK_BYTES = 128 * 1024
+_MAX_DOWNLOAD_WORKERS = 8
+_VERSION_OPERATORS = {'>=': operator.ge, '<=': operator.le, '==': operator.eq, 
+                      '!=': operator.ne, '>': operator.gt, '<': operator.lt}
+
+
+def _is_satisfied(module_name: str, version_constraint: str, version: Optional[str]) -> bool:
+    """Checks the installed distribution against a dependency constraint without invoking pip."""
+    try:
+        installed = metadata.version(module_name)
+    except metadata.PackageNotFoundError:
+        return False
+    if not version:
+        return True
+    try:
+        return _VERSION_OPERATORS[version_constraint](cached_parse(installed), cached_parse(version))
+    except InvalidVersion:
+        return False
+
 
 class PlugIn(Simple):
     """Handles the inspection and management of plugins, either locally or from remote sources.
@@ -37,15 +62,24 @@ class PlugIn(Simple):
                            "files": list of paths or download urls of file contents,
                            "dirs": list of paths or access urls of diretory contents}
     """
+    __slots__ = ('_auth', '_contents', '_remote', '_repository', '_manifest', '_data', '_include',
+                 '_activated', '_dependencies_tested', 'package', '_py_files', '_include_files', '_entry_point',
+                 '_imported_object_cache', '_signature_cache', '_bind_spec', '_tag', '_state')
     _required_key: list = ['package', 'type', 'name', 'source', 'version', 'description', 'dependencies']
     _remote: bool
     _activated: bool
-    _dependencies_tested: bool = False 
+    _dependencies_tested: bool
     _auth: Tuple[str, str]
-    _data: Dict = {}
+    _data: Dict[str, bytearray]
     _contents: Dict
     _repository: Optional[str]
-    _include: Dict = {}
+    _include: Dict
+    _py_files: Dict
+    _include_files: List[Tuple[str, str]]
+    _entry_point: Optional[Tuple[str, Optional[str]]]
+    _bind_spec: Union[Tuple[Tuple[str, ...], frozenset], bool, None]
+    _tag: str
+    _state: str
     
     def __init__(self, 
                  contents: dict, 
@@ -64,6 +98,14 @@ class PlugIn(Simple):
         self._contents = contents
         self._remote = remote
         self._repository = repository if remote else None
+        self._data = {}
+        self._include = {}
+        self._dependencies_tested = False
+        self._tag = ''
+        self._state = ''
+        self._imported_object_cache = None
+        self._signature_cache = None
+        self._bind_spec = None
         self._content_parser()
 
     ## Preparation step: starts
@@ -73,7 +115,9 @@ class PlugIn(Simple):
         This method sets the plugin's parameters and determines its validity based on the availability
         and correctness of the required data.
         """
-        if len(self._contents['files']) == 0:
+        files = self._contents['files']
+        self._py_files = {f:url for f, url in files.items() if f.endswith('.py')}
+        if len(files) == 0:
             self.is_valid = False
             return None
         self._parse_files()
@@ -81,9 +125,13 @@ class PlugIn(Simple):
         
     def _parse_files(self):
         """Parse manifest from contents and load."""
-        for filename, file_loc in self._contents['files'].items():
-            if filename.lower() == 'manifest.yaml':
-                self._load_manifest(file_loc)
+        files = self._contents['files']
+        file_loc = files.get('manifest.yaml')
+        if file_loc is None:
+            # fall back to a case-insensitive scan only for unconventionally named manifests
+            file_loc = next((loc for filename, loc in files.items() if filename.lower() == 'manifest.yaml'), None)
+        if file_loc is not None:
+            self._load_manifest(file_loc)
             
     def _load_manifest(self, file_loc: Union[str, Path]):
         """Loads the plugin's manifest from a remote URL.
@@ -94,16 +142,18 @@ class PlugIn(Simple):
         This method fetches and parses the plugin's manifest file, setting flags based on the contents.
         """
         if self._remote:
-            bytes_data = b''.join(self._download_buffer(file_loc, auth=self._auth))
-            self._manifest = yaml.safe_load(bytes_data)
+            from xnippet.config.loader import load_yaml_bytes
+            self._manifest = load_yaml_bytes(self._read_all(file_loc))
         else:
-            with open(file_loc, 'r') as f:
-                self._manifest = yaml.safe_load(f)
+            # local plugins are re-instantiated on every listing of installed plugins;
+            # load_yaml memoizes by (path, mtime, size) and hands each plugin its own copy
+            from xnippet.config.loader import load_yaml
+            self._manifest = load_yaml(file_loc)
         if any(k not in list(self._manifest.keys()) for k in self._required_key):
             comment = ["Please verify the manifest file's structure. Ensure it includes all required keys: ",
                        "'package', 'plugin', 'source', 'dependencies'. For more details, refer to the documentation: ",
                        "https://github.com/xoani/xnippet/blob/master/examples/docs/PLUGIN.md"]
-            WarnRaiser('self._load_manifest').compliance_warning(comment=''.join(comment))
+            WarnRaiser(self._load_manifest).manifest_noncompliance(comment=''.join(comment))
             self.is_valid = False
         else:
             self.is_valid = True
@@ -115,10 +165,23 @@ class PlugIn(Simple):
             self.name = info['name']
             self.package = info['package'] if 'package' in info.keys() else None
             self.type = info['type']
+            self._parse_source(info['source'])
             self.is_valid = True
-        except (KeyError, AttributeError):
+        except (KeyError, AttributeError, TypeError):
             self.is_valid = False
         self._activated = False if self._remote else True
+        if self.is_valid:
+            # __repr__ only reads _state; download() rebuilds it from _tag once the plugin is activated
+            self._tag = f"[{self.package}]::{self.name}=={self.version}"
+            self._state = f'{self._tag}+Remote @{self._repository}' if self._remote else self._tag
+    
+    def _parse_source(self, source: dict):
+        """Normalizes the manifest's source section once into include files and the (filename, target) entry point."""
+        include = source['include'] if 'include' in source else None
+        include = [include] if isinstance(include, str) else (include or [])
+        self._include_files = [(filename, filename.replace(".py", "")) for filename in include if filename.endswith('.py')]
+        matched = _SOURCE_RE.match(source['entry_point'])
+        self._entry_point = matched.groups() if matched else None
     ## Preperation step: ends
 
     ## Execution step: starts
@@ -139,10 +202,9 @@ class PlugIn(Simple):
         Raises:
             ValueError: If the provided arguments do not match the required function signature.
         """
-        sig = inspect.signature(self._imported_object)
         try:
             # This will raise a TypeError if the arguments do not match the function signature
-            sig.bind(*args, **kwargs)
+            self._bind_arguments(args, kwargs)
         except TypeError as e:
             raise TypeError(f"Argument mismatch for the imported module: {e}")
         if not self._dependencies_tested and not skip_dependency_check:
@@ -161,46 +223,117 @@ class PlugIn(Simple):
                                     Defaults to False.
         """
         if not self._remote:
-            WarnRaiser(self._activated).download_failed(comment="The plugin is already available locally and cannot be downloaded again.")
+            WarnRaiser(self.download).download_error(comment="The plugin is already available locally and cannot be downloaded again.")
             return False
         print(f"\n++ Downloading remote module to '{dest or 'memory'}'.")
         files = self._contents['files'] if dest else self._get_module_files()
-        for filename, download_url in tqdm(files.items(), desc=' -Files', ncols=80):
-            if dest:
-                # The plugin will be downloaded on the folder with the name
-                plugin_path: Path = (Path(dest).resolve() / f'{self.name}_{str(self.version)}')
-                plugin_path.mkdir(exist_ok=True)
-                plugin_file: Path = plugin_path / filename
-                if plugin_file.exists() and not force:
-                    WarnRaiser(self.download).file_exist(filename, comment="Skipping download. Use 'force=True' to overwrite.")
-                    continue
-                with open(plugin_file, 'wb') as f:
-                    for chunk in self._download_buffer(download_url, auth=self._auth):
-                        f.write(chunk)
-            else:
-                # When downloading to memory
-                self._data[filename] = b''.join(self._download_buffer(download_url, auth=self._auth))
-                self._activated = True  # Mark the module as loaded
+        plugin_path, existing = None, frozenset()
+        if dest:
+            # The plugin will be downloaded on the folder with the name
+            plugin_path = Path(dest).resolve() / f'{self.name}_{str(self.version)}'
+            plugin_path.mkdir(exist_ok=True)
+            # one directory listing replaces an exists() check per file
+            existing = frozenset() if force else frozenset(p.name for p in plugin_path.iterdir())
+        # Downloads are network bound, so overlapping the per-file round trips with threads pays off
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_DOWNLOAD_WORKERS, len(files)))) as executor:
+            jobs = executor.map(lambda item: self._download_file(*item, plugin_path=plugin_path, existing=existing), 
+                                files.items())
+            for _ in tqdm(jobs, total=len(files), desc=' -Files', ncols=80):
+                pass
+        if plugin_path is None and files:
+            self._activated = True  # Mark the module as loaded
+            self._state = f'{self._tag}+InMemory'
+    
+    def _download_file(self, filename: str, download_url: str, 
+                       plugin_path: Optional[Path] = None, existing: frozenset = frozenset()):
+        """Downloads a single plugin file into the plugin folder, or into memory if no folder is given.
+
+        Files named in `existing` are already present in the plugin folder and are skipped.
+        """
+        if plugin_path:
+            if filename in existing:
+                WarnRaiser(self.download).file_exists(filename, comment="Skipping download. Use 'force=True' to overwrite.")
+                return
+            with open(plugin_path / filename, 'wb') as f:
+                for chunk in self._download_buffer(download_url, chunk_size=_DOWNLOAD_CHUNK_BYTES, auth=self._auth):
+                    f.write(chunk)
+        else:
+            # When downloading to memory; item assignment on a dict is atomic, so no lock is needed
+            self._data[filename] = self._read_all(download_url)
+    
+    def _read_all(self, url: str) -> bytearray:
+        """Downloads the file at the given URL into memory, growing a single buffer chunk by chunk.
+
+        The buffer itself is returned; ModuleLoader executes it as is, so the source is never copied.
+        """
+        buffer = bytearray()
+        for chunk in self._download_buffer(url, chunk_size=_DOWNLOAD_CHUNK_BYTES, auth=self._auth):
+            buffer += chunk
+        return buffer
     
     def resolve_dependencies(self):
         """Checks and installs any missing dependencies specified in the plugin's manifest file."""
-        ptrn = r'(\w+)\s*(>=|<=|==|!=|>|<)\s*([0-9]+(?:\.[0-9]+)*)?'
         deps = self._manifest['dependencies']
         print(f"++ Resolving python module dependencies...\n  -> {deps}")
+        to_install = []
         for module in tqdm(deps, desc=' -Dependencies', ncols=80):
-            if matched := re.match(ptrn, module):
-                self._status = None
+            if matched := _DEP_RE.match(module):
                 module_name, version_constraint, version = matched.groups()
-                ModuleInstaller().install(module_name=module_name,
-                                          version_constraint=version_constraint, 
-                                          version=version)
-        self._dependencies_tested = True
+                if _is_satisfied(module_name, version_constraint, version):
+                    continue
+                to_install.append(f"{module_name}{version_constraint}{version}" if version else module_name)
+        # one pip process for every unmet dependency instead of one per dependency
+        if ModuleInstaller().install_many(to_install):
+            self._dependencies_tested = True
 
     def _get_module_files(self):
-        return {f:url for f, url in self._contents['files'].items() if f.endswith('.py')} 
+        return self._py_files
     
     @property
     def _imported_object(self):
+        """The entry point object of the plugin, imported on first access and reused afterwards."""
+        if self._imported_object_cache is None:
+            self._imported_object_cache = self._resolve_imported_object()
+        return self._imported_object_cache
+    
+    @property
+    def _signature(self) -> inspect.Signature:
+        """The call signature of the entry point, inspected once."""
+        if self._signature_cache is None:
+            self._signature_cache = inspect.signature(self._imported_object)
+        return self._signature_cache
+    
+    def _bind_arguments(self, args: tuple, kwargs: dict):
+        """Validates call arguments against the entry point signature, raising TypeError on mismatch.
+
+        Signatures made only of positional-or-keyword parameters are checked against the cached parameter
+        names and required set; anything else falls back to `inspect.Signature.bind`.
+        """
+        if self._bind_spec is None:
+            params = self._signature.parameters.values()
+            if all(p.kind is p.POSITIONAL_OR_KEYWORD for p in params):
+                self._bind_spec = (tuple(p.name for p in params), 
+                                   frozenset(p.name for p in params if p.default is p.empty))
+            else:
+                self._bind_spec = False
+        if not self._bind_spec:
+            self._signature.bind(*args, **kwargs)
+            return None
+        names, required = self._bind_spec
+        # checks follow the order of Signature.bind so the first reported mismatch is the same
+        for name in names[:len(args)]:
+            if name in kwargs:
+                raise TypeError(f"multiple values for argument '{name}'")
+        if len(args) > len(names):
+            raise TypeError('too many positional arguments')
+        for name in names[len(args):]:
+            if name in required and name not in kwargs:
+                raise TypeError(f"missing a required argument: '{name}'")
+        for key in kwargs:
+            if key not in names:
+                raise TypeError(f"got an unexpected keyword argument '{key}'")
+    
+    def _resolve_imported_object(self):
         """Dynamically imports the module from loaded data.
 
         This method uses the information from the manifest to import the specified module and method dynamically.
@@ -210,31 +343,24 @@ class PlugIn(Simple):
         """
         if not self._activated:
             self.download()
+        # source bytes for remote plugins, file paths for local ones
+        module_files = self._data if self._remote else self._contents['files']
+        loaded = self._include
         # run include dependency
-        if include := self._manifest['source']['include'] if 'include' in self._manifest['source'] else None:
-            if isinstance(include, str):
-                include = [include]
-            for filename in include:
-                if filename.endswith('.py'):
-                    mloc = self._data[filename] if self._remote else self._contents['files'][filename]
-                    loader = ModuleLoader(mloc)
-                    module_name = filename.replace(".py", "")
-                    module = loader.get_module(module_name)
-                    self._include[module_name] = module
+        for filename, module_name in self._include_files:
+            # modules already executed for this plugin are reused from self._include
+            if module_name not in loaded:
+                loaded[module_name] = ModuleLoader(module_files[filename]).get_module(module_name)
         
         # load entry point
-        source = self._manifest['source']['entry_point']
-        ptrn = r'(?P<filename>[a-zA-Z0-9_-]+\.py)(?::(?P<target>[a-zA-Z][a-zA-Z0-9\_\-]*))?'
-        if matched := re.match(ptrn, source):
-            filename, target = matched.groups()
-            mloc = self._data[filename] if self._remote else self._contents['files'][filename]
-            loader = ModuleLoader(mloc)
-            module = loader.get_module(self.name)
-            self._include[self.name] = module
+        if self._entry_point:
+            filename, target = self._entry_point
+            if (module := loaded.get(self.name)) is None:
+                module = loaded[self.name] = ModuleLoader(module_files[filename]).get_module(self.name)
             return getattr(module, target)
         
     def help(self, drop: Union[list, str, None] = None):
-        sigs = inspect.signature(self._imported_object).parameters.items()
+        sigs = self._signature.parameters.items()
         if isinstance(drop, str):
             drop = [drop]
         sigs = {s:v for s, v in sigs if s not in drop}.items() if drop else sigs
@@ -252,10 +378,4 @@ class PlugIn(Simple):
         print("\n".join(docstring))
         
     def __repr__(self):
-        if self.is_valid:
-            repr = f"PlugInSnippet[{self.package}]::{self.name}=={self.version}"
-            if self._remote:
-                repr += '+InMemory' if self._activated else f'+Remote @{self._repository}'
-            return repr
-        else:
-            return "PlugInSnippet<?>::InValidPlugin"
+        return f"PlugInSnippet{self._state}" if self.is_valid else "PlugInSnippet<?>::InValidPlugin"
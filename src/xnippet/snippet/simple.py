@@ -4,23 +4,38 @@
 from __future__ import annotations
 import logging
 from xnippet.fetcher.base import Fetcher
+from xnippet.formatter.version import cached_parse
 from typing import TYPE_CHECKING
-from packaging.version import parse
 if TYPE_CHECKING:
-    from packaging.version import _Version as VersionType
+    from typing import Optional
+    from xnippet.formatter.version import Version as VersionType
     from logging import Logger
 
+
+class _LazyLogger:
+    """Class-level descriptor that defers the logger lookup until it is first accessed."""
+    def __init__(self, name: str):
+        self._name = name
+        self._logger: Optional[Logger] = None
+    
+    def __get__(self, instance, owner) -> Logger:
+        if self._logger is None:
+            self._logger = logging.getLogger(self._name)
+        return self._logger
+
+
 class Simple(Fetcher):
+    __slots__ = ('package_name', 'package_version', 'name', 'version', 'type', 'is_valid')
     package_name: str
     package_version: str
     name: str
     version: VersionType
     type: str
     is_valid: bool
-    _logger: Logger = logging.getLogger('xnippetSnippet')
+    _logger: Logger = _LazyLogger('xnippetSnippet')
     
     def parse_version(self, version_string):
-        self.version = parse(version_string)
+        self.version = cached_parse(version_string)
 
     def __repr__(self):
         if self.is_valid:
@@ -1,13 +1,15 @@
+from typing import TYPE_CHECKING
 from typing import Type, Optional, Union
 from typing import Literal, Tuple, List
 from pathlib import Path
-from .manager import Manager
-from .fetcher import SnippetsFetcher
-from .fetcher import PlugInFetcher
-from .fetcher.base import Fetcher
-from .snippet import SimpleSnippet
-from .snippet import PlugInSnippet
-from packaging.version import _Version as VersionType
+from .formatter.version import Version as VersionType
+if TYPE_CHECKING:
+    from .manager import Manager
+    from .fetcher import SnippetsFetcher
+    from .fetcher import PlugInFetcher
+    from .fetcher.base import Fetcher
+    from .snippet import SimpleSnippet
+    from .snippet import PlugInSnippet
 
 class Resource:
     def to_dict(self):
@@ -15,15 +17,15 @@ class Resource:
 
 ResourceType = Type[Union[Resource, List[Resource]]]
 
-XnippetManagerType = Type[Manager]
+XnippetManagerType = Type['Manager']
 
 StorageMode = Literal['local', 'global']
 
-FetcherType = Type[Fetcher]
+FetcherType = Type['Fetcher']
 
-SnippetsFetcherType = Type[SnippetsFetcher]
+SnippetsFetcherType = Type['SnippetsFetcher']
 
-PlugInFetcherType = Type[PlugInFetcher]
+PlugInFetcherType = Type['PlugInFetcher']
 
 SnippetPath = Tuple[Optional[Path], bool]
 
@@ -31,9 +33,9 @@ SnippetMode = Literal[
     'plugin', 'preset', 'spec', 'recipe'
     ]
 
-SimpleSnippetType = Type[SimpleSnippet]
+SimpleSnippetType = Type['SimpleSnippet']
 
-PlugInSnippetType = Type[PlugInSnippet]
+PlugInSnippetType = Type['PlugInSnippet']
 
 
 __all__ = [
@@ -1,3 +1,5 @@
+import os
+import shutil
 import logging
 
 def test_config_empty(pytest, xnippet, colored, presets, default_config):
@@ -25,3 +27,64 @@ def test_config_examp(xnippet, presets, colored, default_config):
     logging.info(colored("++ Case 3. Xnippet initiate with package's default config file.", 'blue'))
     xnippet_expt = xnippet.XnippetManager(**presets[1])
     assert xnippet_expt.config != default_config, "Example config != default config"
+
+def test_load_yaml_reparse(colored, tmp_path):
+    logging.info(colored('++ Case 4. Edited YAML sources are parsed again.', 'blue'))
+    from xnippet.config.loader import load_yaml
+    source = tmp_path / 'config.yaml'
+    source.write_text('value: 1\n')
+    loaded = load_yaml(source)
+    assert loaded == {'value': 1}
+    loaded['value'] = 0
+    assert load_yaml(source) == {'value': 1}, "Cached document must not be shared with callers"
+    
+    logging.info(' + Same-size edit with a new mtime.')
+    mtime_ns = source.stat().st_mtime_ns
+    source.write_text('value: 2\n')
+    os.utime(source, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert load_yaml(source) == {'value': 2}
+    
+    logging.info(' + Edit that changes the size.')
+    source.write_text('value: 300\n')
+    assert load_yaml(source) == {'value': 300}
+    assert [p.name for p in tmp_path.iterdir()] == ['config.yaml'], "No snapshot is written next to the source"
+
+def test_config_reload(pytest, xnippet, colored, tmp_path, monkeypatch):
+    logging.info(colored('++ Case 5. Edited config is re-read on reload.', 'blue'))
+    monkeypatch.chdir(tmp_path)
+    kwargs = {"package_name": "xnippet", 
+              "package_version": xnippet.__version__, 
+              "package__file__": tmp_path / 'package.py'}
+    with pytest.warns():
+        manager = xnippet.XnippetManager(**kwargs)
+    manager.create_config('local')
+    fetcher = manager._fetcher
+    
+    logging.info(' + Unchanged config skips the reload unless forced.')
+    manager.reload()
+    assert manager._fetcher is fetcher
+    manager.reload(force=True)
+    assert manager._fetcher is not fetcher
+    
+    logging.info(' + Edited config is picked up by a plain reload.')
+    config_file = tmp_path / '.xnippet' / 'config.yaml'
+    config_file.write_text(config_file.read_text() + 'edited: true\n')
+    manager.reload()
+    assert manager.config['edited'] is True
+
+def test_installed_index(pytest, xnippet, colored, tmp_path, monkeypatch, local_plugin):
+    logging.info(colored('++ Case 6. Installed index follows the plugin folder.', 'blue'))
+    monkeypatch.chdir(tmp_path)
+    kwargs = {"package_name": "xnippet", 
+              "package_version": xnippet.__version__, 
+              "package__file__": tmp_path / 'package.py'}
+    with pytest.warns():
+        manager = xnippet.XnippetManager(**kwargs)
+    manager.create_config('local')
+    assert not manager.is_installed('demo')
+    
+    logging.info(' + Copy a plugin into the plugin folder.')
+    shutil.copytree(local_plugin._contents['path'], tmp_path / '.xnippet' / 'plugin' / 'demo')
+    assert 'demo==0.1.0' in [f'{p.name}=={p.version}' for p in manager.installed]
+    assert manager.is_installed('demo')
+    assert manager.is_installed('demo', '0.1.0')
@@ -1,6 +1,6 @@
 import logging
 import yaml
-from pathlib import Path
+from xnippet.config.loader import SafeLoader as _SafeLoader
 
 def test_base_fetcher(colored, xnippet, github_repo, auth):
     logging.info(colored("++ Case 1. Test BaseFetcher.", 'blue'))
@@ -18,17 +18,17 @@ def test_base_fetcher(colored, xnippet, github_repo, auth):
     logging.info(f" + Get download url of `manifest.yaml`: %s", download_url)
     
     logging.info(f" + Downloading, %s...", file_to_download)
-    bff = b"".join(BaseFetcher._download_buffer(url=download_url, auth=auth))
-    result = yaml.safe_load(bff)
+    buf = bytearray()
+    for chunk in BaseFetcher._download_buffer(url=download_url, auth=auth):
+        buf.extend(chunk)
+    result = yaml.load(bytes(buf), Loader=_SafeLoader)
     logging.info(" - Downloaded PlugIn: %s", result['plugin']['name'])
 
-def test_snippets_fetcher(colored, xnippet, auth):
+def test_snippets_fetcher(colored, xnippet, auth, default_config):
     logging.info(colored('++ Case 2. Test SnippetFetcher.', 'blue'))
     SnippetsFetcher = xnippet.fetcher.SnippetsFetcher
-    config = Path(__file__).parents[1] / 'src' / 'xnippet' / 'config' / 'main.yaml'
-    logging.info(f" + Load default config: %s", config)
-    with open(config, 'r') as f:
-        repo = yaml.safe_load(f)['xnippet']['repo']
+    logging.info(f" + Load default config from session cache.")
+    repo = default_config['xnippet']['repo']
     filtered_repo = SnippetsFetcher._inspect_repos(repo)
     assert len(filtered_repo) == len(repo)
     
@@ -0,0 +1,127 @@
+import inspect
+import logging
+import itertools
+import pytest
+
+_POSITIONALS = [(), (1,), (1, 2), (1, 2, 3), (1, 2, 3, 4)]
+_KEYWORDS = [{}, {'a': 1}, {'b': 2}, {'c': 3}, {'d': 4}, {'a': 1, 'd': 4}, {'b': 2, 'c': 3}]
+
+
+def _outcome(bind, args, kwargs):
+    try:
+        bind(args, kwargs)
+    except TypeError as e:
+        return str(e)
+    return None
+
+@pytest.mark.parametrize('args, kwargs', list(itertools.product(_POSITIONALS, _KEYWORDS)))
+def test_plugin_bind_arguments(colored, local_plugin, args, kwargs):
+    logging.info(colored("++ Case 1. PlugIn argument validation matches Signature.bind.", 'blue'))
+    logging.info(" + Validate %s, %s against Signature.bind.", args, kwargs)
+    signature = inspect.signature(local_plugin._imported_object)
+    expected = _outcome(lambda a, k: signature.bind(*a, **k), args, kwargs)
+    assert _outcome(local_plugin._bind_arguments, args, kwargs) == expected
+    
+def test_plugin_run(colored, local_plugin):
+    logging.info(colored("++ Case 2. Run local plugin.", 'blue'))
+    assert local_plugin.is_valid
+    assert repr(local_plugin) == "PlugInSnippet[xnippet>=0.1.0]::demo==0.1.0"
+    assert local_plugin.run(True, 1, 2) == 9
+    assert local_plugin.run(True, 1, b=2, c=1) == 3
+
+@pytest.mark.parametrize('installed, constraint, version, expected', [
+    ('6.0.1', '>=', '5.0', True),
+    ('6.0.1', '<', '5.0', False),
+    ('6.0.1', '==', '6.0.1', True),
+    ('6.0.1', '>=', None, True),
+    (None, '>=', '5.0', False),
+    ('not-a-version', '>=', '5.0', False),
+    ])
+def test_dependency_satisfied(colored, monkeypatch, installed, constraint, version, expected):
+    logging.info(colored("++ Case 3. Check installed dependency against its constraint.", 'blue'))
+    logging.info(" + installed=%s, required=%s%s", installed, constraint, version)
+    from importlib import metadata
+    from xnippet.snippet.plugin import _is_satisfied
+    
+    def fake_version(name):
+        if installed is None:
+            raise metadata.PackageNotFoundError(name)
+        return installed
+    
+    monkeypatch.setattr(metadata, 'version', fake_version)
+    assert _is_satisfied('somepackage', constraint, version) is expected
+
+class _FakePopen:
+    calls = []
+    returncode = 0
+    
+    def __init__(self, cmd, **kwargs):
+        _FakePopen.calls.append(cmd)
+        self.stdout = iter(["Collecting package\n"])
+        self.stderr = iter(["pip failed\n"])
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def wait(self):
+        return self.returncode
+
+def test_install_many(colored, monkeypatch):
+    logging.info(colored("++ Case 4. Install dependencies with a single pip call.", 'blue'))
+    import subprocess
+    from xnippet.module import ModuleInstaller
+    
+    def no_popen(*args, **kwargs):
+        raise AssertionError("pip must not be started without specs")
+    
+    logging.info(" + Nothing to install.")
+    monkeypatch.setattr(subprocess, 'Popen', no_popen)
+    assert ModuleInstaller().install_many([]) is True
+    
+    logging.info(" + Several specs in one invocation.")
+    _FakePopen.calls = []
+    monkeypatch.setattr(subprocess, 'Popen', _FakePopen)
+    assert ModuleInstaller().install_many(['numpy>=1.20', 'scipy']) is True
+    assert len(_FakePopen.calls) == 1
+    assert _FakePopen.calls[0][-4:] == ['pip', 'install', 'numpy>=1.20', 'scipy']
+    
+    logging.info(" + Failed pip run.")
+    monkeypatch.setattr(_FakePopen, 'returncode', 1)
+    with pytest.warns(UserWarning):
+        assert ModuleInstaller().install_many(['numpy>=1.20']) is False
+    
+def test_resolve_dependencies(colored, monkeypatch, local_plugin):
+    logging.info(colored("++ Case 5. Resolve unmet plugin dependencies.", 'blue'))
+    from importlib import metadata
+    from xnippet.module import ModuleInstaller
+    requested = []
+    
+    def fake_install_many(self, specs, upgrade=False):
+        requested.append(list(specs))
+        return False
+    
+    def not_found(name):
+        raise metadata.PackageNotFoundError(name)
+    
+    monkeypatch.setattr(ModuleInstaller, 'install_many', fake_install_many)
+    monkeypatch.setattr(metadata, 'version', not_found)
+    local_plugin.resolve_dependencies()
+    assert requested == [['pyyaml>=5.0']]
+    assert not local_plugin._dependencies_tested, "A failed install must not mark dependencies as tested"
+
+def test_plugin_repr_in_memory(colored, monkeypatch, local_plugin):
+    logging.info(colored("++ Case 6. Download remote plugin into memory.", 'blue'))
+    from pathlib import Path
+    from xnippet.snippet import PlugInSnippet
+    # serve "downloads" from the local plugin folder
+    monkeypatch.setattr(PlugInSnippet, '_read_all', lambda self, url: bytearray(Path(url).read_bytes()))
+    contents = local_plugin._contents
+    remote = PlugInSnippet(contents=contents, remote=True, repository='repo+Remote')
+    assert repr(remote) == "PlugInSnippet[xnippet>=0.1.0]::demo==0.1.0+Remote @repo+Remote"
+    for _ in range(2):
+        remote.download()
+        assert repr(remote) == "PlugInSnippet[xnippet>=0.1.0]::demo==0.1.0+InMemory"
+    assert remote.run(True, 1, 2) == 9, "Modules run straight from the downloaded buffers"
@@ -1,18 +1,36 @@
 import os
-import yaml
 import shutil
 import pytest as pytest_
 import xnippet as xnippet_
 from pathlib import Path
 from xnippet.formatter import IOFormatter
+from xnippet.config.loader import load_yaml
+
+
+_PYTEST_DIR = Path(__file__).resolve().parent
+_DEFAULT_CONFIG_PATH = _PYTEST_DIR.parent / 'src/xnippet/config/main.yaml'
+
+_EMPTY_KWARGS = {
+    "package_name": "xnippet",
+    "package_version": xnippet_.__version__,
+    "package__file__": __file__,  # current folder
+    "config_path": None,       # in current folder
+    "config_filename": 'config.yaml'
+}  # init args
+
+_EXAMP_KWARGS = {
+    "package_name": "xnippet-examp",
+    "package_version": xnippet_.__version__,
+    "package__file__": _PYTEST_DIR,
+    "config_path": 'examples',
+    "config_filename": 'example_config.yaml'}
 
 
 def pytest_configure(config):
-    xnippet_.setup_logging(path=Path(__file__).parent / 'logging.yaml')
+    xnippet_.setup_logging(path=_PYTEST_DIR / 'logging.yaml')
 
 @pytest_.fixture(scope="session")
 def presets(request):
-    pytest_dir = Path(__file__).resolve().parent
     cur_path = Path(os.curdir).resolve()
     
     def return_working_directory():
@@ -21,30 +39,12 @@ def presets(request):
         os.chdir(cur_path)
         
     request.addfinalizer(return_working_directory)
-    
-    empty_kwargs = {
-        "package_name": "xnippet",
-        "package_version": xnippet_.__version__,
-        "package__file__": __file__,  # current folder
-        "config_path": None,       # in current folder
-        "config_filename": 'config.yaml'
-    }  # init args
-    
-    examp_kwargs = {
-        "package_name": "xnippet-examp",
-        "package_version": xnippet_.__version__,
-        "package__file__": pytest_dir,
-        "config_path": 'examples',
-        "config_filename": 'example_config.yaml'}
-    
-    return empty_kwargs, examp_kwargs
+    return _EMPTY_KWARGS, _EXAMP_KWARGS
         
 
-@pytest_.fixture(scope="function")
+@pytest_.fixture(scope="session")
 def default_config():
-    with open(Path.resolve(Path(__file__).parents[1] / 'src/xnippet/config/main.yaml'), 'r') as f:
-        default_config = yaml.safe_load(f)
-    return default_config
+    return load_yaml(_DEFAULT_CONFIG_PATH)
 
 @pytest_.fixture(scope='function')
 def pytest():
@@ -64,6 +64,27 @@ def auth():
     auth = ('token', os.environ["XNIPPET_TOKEN"]) if "XNIPPET_TOKEN" in os.environ.keys() else None
     return auth
 
+@pytest_.fixture(scope='function')
+def local_plugin(tmp_path):
+    """Write a minimal local plugin to a temporary folder and return its PlugInSnippet."""
+    plugin_dir = tmp_path / 'demo'
+    plugin_dir.mkdir()
+    (plugin_dir / 'manifest.yaml').write_text(
+        "package: xnippet>=0.1.0\n"
+        "type: plugin\n"
+        "name: demo\n"
+        "version: 0.1.0\n"
+        "description: plugin for testing\n"
+        "source:\n"
+        "  entry_point: main.py:func\n"
+        "dependencies:\n"
+        "  - pyyaml>=5.0\n")
+    (plugin_dir / 'main.py').write_text("def func(a, b, c=3):\n    return (a + b) * c\n")
+    contents = {'path': plugin_dir, 
+                'dirs': {}, 
+                'files': {f.name: f for f in plugin_dir.iterdir()}}
+    return xnippet_.snippet.PlugInSnippet(contents=contents)
+
 @pytest_.fixture(scope='session')
 def colored():
     return IOFormatter.colored
\ No newline at end of file